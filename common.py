@@ -0,0 +1,280 @@
+# Shared constants and cached helpers for app.py.
+# Defined here (imported once per process) instead of being re-executed on every rerun.
+
+import streamlit as st
+import pandas as pd
+from pathlib import Path
+from scout_core import radar_data, radar_plotly, FEATURES_12
+from scout_core import top_players, TopPlayersParams, FEATURE_MAP, FEATURE_MAP_KEYS, STANDARD_COLS
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# -------------------------------
+# Banner
+# -------------------------------
+
+# --- Paths ---
+# served as a static file (see .streamlit/config.toml) so the browser caches it
+BANNER_PATH = BASE_DIR / "static" / "cover2.png"
+
+# styles live in assets/banner.css, read once per process
+# (still sent with the banner each rerun: Streamlit drops elements a rerun doesn't emit)
+BANNER_CSS = (BASE_DIR / "assets" / "banner.css").read_text(encoding="utf-8")
+
+BANNER_HTML = f"<style>\n{BANNER_CSS}</style>\n" + """
+        <div class="banner-wrap">
+            <div class="banner-overlay"></div>
+            <div class="banner-text">
+                <h1>Football Scout</h1>
+                <p>
+                    Scout players from +10 leagues with interactive charts<br> 
+                </p>
+            </div>
+        </div>
+        """
+
+# -------------------------------
+# Helpers
+# -------------------------------
+
+def asset_mtime(path) -> float:
+    # passed to every cached loader with the path: replacing a parquet on disk changes the key,
+    # so only that file's entries are recomputed (no global cache clear)
+    return Path(path).stat().st_mtime
+
+CATEGORY_COLS = ("League", "Position", "Squad", "Nation")
+# smallest dtypes that fit the filter columns (nullable, so a missing value never breaks the load)
+DOWNCAST_COLS = {"Age": "UInt8", "Minutes": "Int32", "Market Value (M€)": "float32"}
+# pre-scaled score/feature columns: float32 halves the bytes streamed through scoring and radars
+FEATURE_COLS = frozenset([*FEATURE_MAP, *(c for cols in FEATURE_MAP.values() for c in cols), *FEATURES_12])
+
+def _compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    # low-cardinality filter columns -> category (int-code compares, cheap unique())
+    for c in CATEGORY_COLS:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+    # narrower numerics -> fewer bytes through the filter masks
+    for c, dtype in DOWNCAST_COLS.items():
+        if c in df.columns:
+            df[c] = pd.to_numeric(df[c], errors="coerce").astype(dtype)
+    feats = [c for c in df.columns if c in FEATURE_COLS]
+    if feats:
+        df[feats] = df[feats].astype("float32")
+    return df
+
+@st.cache_resource
+def load_df(path, mtime: float, columns: tuple) -> pd.DataFrame:
+    # shared read-only frame, one per column projection (tuple, hashable): never mutate it in place
+    return _compact_dtypes(
+        pd.read_parquet(path, columns=list(columns), engine="pyarrow", memory_map=True)
+    )
+
+@st.cache_data(max_entries=64, ttl="1h")
+def load_filtered_tab1(path, mtime: float, columns: tuple, leagues: tuple, positions: tuple,
+                       min_age: int, max_age: int) -> pd.DataFrame:
+    # League/Position/Age predicates pushed into the parquet scan; MV stays in top_players (keeps NaN MVs)
+    filters = [("Age", ">=", min_age), ("Age", "<=", max_age)]
+    if leagues:
+        filters.append(("League", "in", list(leagues)))
+    if positions:
+        filters.append(("Position", "in", list(positions)))
+    return _compact_dtypes(
+        pd.read_parquet(path, columns=list(columns), filters=filters, engine="pyarrow", memory_map=True)
+    )
+
+@st.cache_data(show_spinner=False, max_entries=64, ttl="1h")
+def cached_top_players(path, mtime: float, leagues: tuple, pos_filter: tuple, min_age: int, max_age: int,
+                       max_MV: float, selected_features: tuple, top_n: int) -> pd.DataFrame:
+    # pure function of the Search inputs (all hashable), so repeated searches are instant
+    # league/position/age filters are applied while reading the parquet, so only matching rows are decoded
+    df_work = load_filtered_tab1(path, mtime, TAB1_COLS, leagues, pos_filter, min_age, max_age)
+    params = TopPlayersParams(
+        n=top_n,
+        min_age=min_age,
+        max_age=max_age,
+        max_MV=max_MV,
+    )
+    return top_players(df=df_work, selected_features=list(selected_features), params=params)
+
+@st.cache_data
+def tab1_meta(path, mtime: float) -> dict:
+    # widget metadata depends only on the file, so compute it once from the columns it needs
+    meta = _compact_dtypes(
+        pd.read_parquet(path, columns=["League", "Position", "Market Value (M€)"], engine="pyarrow")
+    )
+    mv_max = float(meta["Market Value (M€)"].max() or 200.0)
+    # frozensets from the categories (no unique() scan): O(1) `code in ...` checks in the widgets
+    return {
+        "leagues_set": frozenset(meta["League"].cat.categories),
+        "positions_set": frozenset(meta["Position"].cat.categories),
+        "mv_max": int(round(mv_max)),
+    }
+
+def _league_options(codes_present) -> tuple:
+    # (display options, display -> code map) for a League selectbox
+    codes = [code for code in LEAGUE_NAMES if code in codes_present]
+    display_options = ["All"] + [LEAGUE_NAMES[code] for code in codes]
+    return display_options, LEAGUE_DISPLAY_TO_CODE
+
+@st.cache_data
+def league_widget_options(path, mtime: float) -> tuple:
+    # Tab 2 League selectbox
+    leagues = _compact_dtypes(pd.read_parquet(path, columns=["League"], engine="pyarrow"))["League"]
+    return _league_options(set(leagues.cat.categories))
+
+def tab1_league_options(path, mtime: float) -> tuple:
+    # Tab 1 League selectbox, from the league set already cached in tab1_meta (no cache of its own)
+    return _league_options(tab1_meta(path, mtime)["leagues_set"])
+
+def position_widget_options(path, mtime: float) -> tuple:
+    # (display options, display -> code map) for the Tab 1 Position selectbox, built from tab1_meta
+    positions_present = tab1_meta(path, mtime)["positions_set"]
+    codes = [code for code in POSITION_NAMES if code in positions_present]
+    display_options = ["All"] + [POSITION_NAMES[code] for code in codes]
+    return display_options, POSITION_DISPLAY_TO_CODE
+
+@st.cache_data(show_spinner=False)
+def cached_radar(path, mtime: float, players: tuple) -> pd.DataFrame:
+    return radar_data(load_df(path, mtime, TAB2_COLS), list(players))
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def cached_fig(path, mtime: float, players: tuple, fill: bool):
+    # shared figure object: all layout tweaks happen here, never on the returned fig
+    fig = radar_plotly(cached_radar(path, mtime, players), fill=fill, label_map=FEATURE_LABELS)
+    fig.update_layout(
+        autosize=False,
+        margin=dict(l=57, r=57, t=24, b=24)
+    )
+    return fig
+
+@st.cache_data
+def tab2_cascade(path, mtime: float) -> dict:
+    # {league: {squad: {position: sorted players}}}, with an "All" entry at every level
+    df = pd.read_parquet(path, columns=["League", "Squad", "Position", "Player"], engine="pyarrow")
+    df = df[df["Player"].notna()]
+    tree = {}
+    for league, squad, pos, player in df.itertuples(index=False, name=None):
+        # a null League/Squad/Position gets no key of its own, but the player still shows under "All"
+        for l in ("All",) + ((league,) if pd.notna(league) else ()):
+            for sq in ("All",) + ((squad,) if pd.notna(squad) else ()):
+                for p in ("All",) + ((pos,) if pd.notna(pos) else ()):
+                    tree.setdefault(l, {}).setdefault(sq, {}).setdefault(p, set()).add(player)
+    return {
+        l: {sq: {p: sorted(players) for p, players in sorted(by_pos.items())}
+            for sq, by_pos in sorted(by_squad.items())}
+        for l, by_squad in tree.items()
+    }
+ 
+POSITION_ORDER = ["CB","RB","LB","DM","CM","AM","RW","LW","CF"]
+
+LEAGUE_NAMES = {
+    "GB 1": "England - Premier League",
+    "ES 1": "Spain - La Liga",
+    "DE 1": "Germany - Bundesliga",
+    "IT 1": "Italy - Serie A",
+    "FR 1": "France - Ligue 1",  
+    "NL 1": "Netherlands - Eredivisie",
+    "PT 1": "Portugal - Primeira Liga",
+    "BE 1": "Belgium - Pro League",
+    "BR 1": "Brazil - Série A",
+    "AR 1": "Argentina - Liga Profesional",
+    "GB 2": "England - Championship",
+    "IT 2": "Italy - Serie B"
+}
+
+POSITION_NAMES = {
+    "CB": "Centre Back (CB)",
+    "RB": "Right Back (RB)",
+    "LB": "Left Back (LB)",
+    "DM": "Defensive Midfielder (DM)",
+    "CM": "Center Midfielder (CM)",
+    "AM": "Attacking Midfielder (AM)",    
+    "RW": "Rigth Winger (RW)",
+    "LW": "Left Winger (LW)",
+    "CF": "Center Forward (CF)"
+}
+
+# display name -> code, built once (only names of present codes are ever offered)
+LEAGUE_DISPLAY_TO_CODE = {"All": "All"} | {name: code for code, name in LEAGUE_NAMES.items()}
+POSITION_DISPLAY_TO_CODE = {"All": "All"} | {name: code for code, name in POSITION_NAMES.items()}
+
+FEATURE_LABELS = {
+"Goal Scoring": "Scoring",
+"Goal Efficacy": "Efficacy",
+"Shooting": "Shoot",
+"Passing Influence": "Pass Influence",
+"Passing Accuracy": "Pass Accuracy",
+"Goal Creation": "Creation",
+"Possession Influence": "Possession",
+"Progression": "Progression",
+"Dribbling": "Dribbling",
+"Aerial Influence": "Aerial",
+"Defensive Influence": "Defense",
+"Discipline and Consistency": "Consistency"
+}
+
+# Tab 1 results column config, built once at import (NumberColumn objects are reused every rerun)
+BASE_CFG = {
+    "Rank": st.column_config.NumberColumn("", width="small"),
+    "Player": st.column_config.TextColumn("Player", pinned="left"),
+    "Market Value (M€)": st.column_config.NumberColumn("Market Value", format="€ %.1f M"),
+    "Score": st.column_config.NumberColumn("Score", format="%.2f"),
+    "Goal Scoring": st.column_config.NumberColumn("Scoring", format="%.2f"),
+    "Goal Efficacy": st.column_config.NumberColumn("Efficacy", format="%.2f"),
+    "Goal Creation": st.column_config.NumberColumn("Goal Creation", format="%.2f"),
+    "Shooting": st.column_config.NumberColumn("Shooting", format="%.2f"),
+    "Passing Influence": st.column_config.NumberColumn("Pass Inf.", format="%.2f"),
+    "Passing Accuracy": st.column_config.NumberColumn("Pass Acc.", format="%.2f"),
+    "Possession Influence": st.column_config.NumberColumn("Possession", format="%.2f"),  # note spelling
+    "Progression": st.column_config.NumberColumn("Progression", format="%.2f"),
+    "Dribling": st.column_config.NumberColumn("Dribling", format="%.2f"),
+    "Aerial Influence": st.column_config.NumberColumn("Aerial", format="%.2f"),
+    "Defensive Influence": st.column_config.NumberColumn("Defense", format="%.2f"),
+    "Discipline and Consistency": st.column_config.NumberColumn("Disc. & Consist.", format="%.2f"),
+    "Goals_90m": st.column_config.NumberColumn("Gls/90", help="Goals per 90 minutes", format="%.2f", width="small"),
+    "Goals not Penalty_90m": st.column_config.NumberColumn("Gls NP/90", help="Goals not Penalty per 90 minutes", format="%.2f", width="small"),
+    "Goals Minus Expected_90m": st.column_config.NumberColumn("Gls-Exp/90m", help="Goals Minus Expected Goals per 90 minutes", format="%.2f", width="small"),
+    "Goals/Shoot": st.column_config.NumberColumn("Gls/Shoot", help="Goals per Shoots", format="%.2f", width="small"),
+    "Penalty Efficacy": st.column_config.NumberColumn("Pen Eff%", help="Penalty Scored / Penalty Attempts", format="%.2f", width="small"),
+    "Shoots_90m": st.column_config.NumberColumn("Sht/90m", help="Shoots per 90 minutes", format="%.2f", width="small"),
+    "Shoots on Target_90m": st.column_config.NumberColumn("SoT/90m", help="Shoots on Target per 90 minutes", format="%.2f", width="small"),
+    "FreeKick Tacker": st.column_config.NumberColumn("FK Tacker", help="FreeKick Tacker (1 if yes)", format="%.0f", width="small"),
+    "Short Cmp_90m": st.column_config.NumberColumn("Sht Pass/90m", help="Short distance passes completed per 90 minutes", format="%.1f", width="small"),
+    "Medium Cmp_90m": st.column_config.NumberColumn("Med Pass/90m", help="Medium distance passes completed per 90 minutes", format="%.1f", width="small"),
+    "Long Cmp_90m": st.column_config.NumberColumn("Long Pass/90m", help="Long distance passes completed per 90 minutes", format="%.1f", width="small"),
+    "Prog Passes_90m": st.column_config.NumberColumn("Prog Pass/90m", help="Progressive passes completed per 90 minutes", format="%.1f", width="small"),
+    "Pass Prog Distance_90m": st.column_config.NumberColumn("Pass Dist/90m", help="Progressive passes distance per 90 minutes", format="%.1f", width="small"),
+    "Cmp Passes%": st.column_config.NumberColumn("Pass Acc%", help="Completed Passes / Attempted Passes", format="%.1f", width="small"),
+    "Short Cmp%": st.column_config.NumberColumn("Pass Short%", help="Completed Short Passes / Attempted Short Passes", format="%.1f", width="small"),
+    "Medium Cmp%": st.column_config.NumberColumn("Pass Med%", help="Completed Medium Passes / Attempted Medium Passes", format="%.1f", width="small"),
+    "Long Cmp%": st.column_config.NumberColumn("Pass Long%", help="Completed Long Passes / Attempted Long Passes", format="%.1f", width="small"), 
+    "Assists_90m": st.column_config.NumberColumn("Ast/90m", help="Assists per 90 minutes", format="%.2f", width="small"),            
+    "Key Passes_90m": st.column_config.NumberColumn("Key Pass/90m", help="Key Passes per 90 minutes", format="%.2f", width="small"),    
+    "Goal Creating Actions_90m": st.column_config.NumberColumn("GCA/90m", help="Goal Creating Actions per 90 minutes", format="%.2f", width="small"),
+    "Touches_90m": st.column_config.NumberColumn("Touch/90m", help="Touches on the ball per 90 minutes", format="%.1f", width="small"),
+    "Fouls Suffered_90m": st.column_config.NumberColumn("Fls Suf/90m", help="Fouls suffered per 90 minutes", format="%.1f", width="small"),
+    "Carries_90m": st.column_config.NumberColumn("Carr/90m", help="Carries per 90 minutes", format="%.1f", width="small"),      
+    "Prog Carries_90m": st.column_config.NumberColumn("PCarr/90m", help="Progressive Carries per 90 minutes", format="%.1f", width="small"),    
+    "Carries PrgDist_90m": st.column_config.NumberColumn("PCarr Dis/90m", help="Progressive Carries Distance per 90 minutes", format="%.1f", width="small"),  
+    "Take-Ons Succ_90m": st.column_config.NumberColumn("Drb/90m", help="Successfull dribles per 90 minutes", format="%.1f", width="small"),
+    "Take-Ons Succ%": st.column_config.NumberColumn("Drb%", help="Successfull dribles / Attempted", format="%.1f", width="small"),
+    "Aerial Duels_90m": st.column_config.NumberColumn("Aerial/90m", help="Aerials duels per 90 minutes", format="%.1f", width="small"),
+    "Aerial Duels Won%": st.column_config.NumberColumn("Aerial %", help="Aerials Duels Won / Aerial Duels Total", format="%.1f", width="small"),
+    "Tackles Won_90m": st.column_config.NumberColumn("Tkl/90m", help="Tackles won per 90 minutes", format="%.1f", width="small"),
+    "Blocks_90m": st.column_config.NumberColumn("Blk/90m", help="Blocks per 90 minutes", format="%.1f", width="small"),
+    "Interceptions_90m": st.column_config.NumberColumn("Int/90m", help="Interceptions per 90 minutes", format="%.1f", width="small"),
+    "Clearances_90m": st.column_config.NumberColumn("Clr/90m", help="Clearances per 90 minutes", format="%.1f", width="small"),
+    "Ball Recoveries_90m": st.column_config.NumberColumn("Rec/90m", help="Ball Recoveries per 90 minutes", format="%.1f", width="small"),
+    "Own Goals_90m": st.column_config.NumberColumn("OG/90m", help="Own Goals per 90 minutes", format="%.2f", width="small"),
+    "Errors_90m": st.column_config.NumberColumn("Err/90m", help="Errors leading to a shot or goal per 90 minutes", format="%.2f", width="small"),
+    "Yellow Cards_90m": st.column_config.NumberColumn("YC/90m", help="Yellow Cards per 90 minutes", format="%.2f", width="small"),
+    "Red Cards_90m": st.column_config.NumberColumn("RC/90m", help="Red Cards per 90 minutes", format="%.2f", width="small"),
+    "Fouls Commited_90m": st.column_config.NumberColumn("FlsCom/90m", help="Fouls committed per 90 minutes", format="%.1f", width="small"),
+    "Penalty Commited_90m": st.column_config.NumberColumn("PKCom/90m", help="Penalty committed per 90 minutes", format="%.2f", width="small")
+}
+
+# Columns each tab reads from its parquet (projection pushed into the reader)
+TAB1_COLS = tuple(dict.fromkeys(
+    STANDARD_COLS + list(FEATURE_MAP_KEYS) + [c for cols in FEATURE_MAP.values() for c in cols]
+))
+TAB2_COLS = ("Player", "League", "Squad", "Position", "Age", "Market Value (M€)", *FEATURES_12)
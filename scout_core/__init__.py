@@ -1,7 +1,7 @@
 from .compare_players import radar_data, radar_plotly, FEATURES_12
-from .top_players import top_players, TopPlayersParams, FEATURE_MAP,STANDARD_COLS
+from .top_players import top_players, TopPlayersParams, FEATURE_MAP, FEATURE_MAP_KEYS, STANDARD_COLS
 
 __all__ = [
     "radar_data", "radar_plotly","FEATURES_12",
-    "top_players", "TopPlayersParams", "FEATURE_MAP","STANDARD_COLS",
+    "top_players", "TopPlayersParams", "FEATURE_MAP", "FEATURE_MAP_KEYS", "STANDARD_COLS",
 ]
\ No newline at end of file
@@ -1,6 +1,4 @@
 import pandas as pd
-import plotly.graph_objects as go
-import textwrap
 
 FEATURES_12 = [
     "Goal Scoring","Goal Efficacy","Shooting",
@@ -11,23 +9,26 @@ FEATURES_12 = [
 
 def radar_data(df: pd.DataFrame, players, player_col="Player",
                features=FEATURES_12, fillna=0.0) -> pd.DataFrame:
-    data = df.copy()
-
     # choose the MV column name that exists
-    mv_col = "Market Value (M€)" if "Market Value (M€)" in data.columns else (
-             "Market Value"      if "Market Value"      in data.columns else None)
+    mv_col = "Market Value (M€)" if "Market Value (M€)" in df.columns else (
+             "Market Value"      if "Market Value"      in df.columns else None)
 
-    # validate + coerce features
-    for f in features:
-        if f not in data.columns:
-            data[f] = pd.NA
-    data[features] = data[features].apply(pd.to_numeric, errors="coerce").fillna(fillna)
-
-    # filter requested players
-    keep = data[data[player_col].isin(players)]
+    # filter requested players first: only their rows are copied and coerced
+    keep = df.loc[df[player_col].isin(players)].copy()
     if keep.empty:
         raise ValueError("None of the requested players were found.")
 
+    # validate + coerce features
+    for f in features:
+        if f not in keep.columns:
+            keep[f] = pd.NA
+    # only non-numeric columns (e.g. the pd.NA placeholders) go through to_numeric
+    to_coerce = [f for f in features if not pd.api.types.is_numeric_dtype(keep[f])]
+    if to_coerce:
+        keep[to_coerce] = keep[to_coerce].apply(pd.to_numeric, errors="coerce")
+    # float32 is plenty for 0..1 scaled scores and halves the bytes moved by melt
+    keep[features] = keep[features].fillna(fillna).astype("float32")
+
     # carry meta columns into df_long ---
     meta_cols = ["Age", "Squad"] + ([mv_col] if mv_col else [])
     meta_cols = [c for c in meta_cols if c in keep.columns]
@@ -41,27 +42,28 @@ def radar_data(df: pd.DataFrame, players, player_col="Player",
     return df_long
 
 def radar_plotly(df_long: pd.DataFrame, fill=True, label_map=None):
+    import plotly.graph_objects as go  # lazy: plotly only loads when a radar is drawn
+
     features = FEATURES_12
     labels = [label_map.get(f, f) for f in features] if label_map else features
     fig = go.Figure()
 
-    for player, sub in df_long.groupby("Player"):
-        # values in the correct order
-        vals = sub.set_index("Feature").reindex(features)["Value"].tolist()
+    # one pivot for all players (rows sorted by name, columns in feature order)
+    wide = df_long.pivot(index="Player", columns="Feature", values="Value").reindex(columns=features)
+    meta = df_long.drop_duplicates("Player").set_index("Player").drop(columns=["Feature", "Value"])
+    mv_col = ("Market Value (M€)" if "Market Value (M€)" in meta.columns else
+              "Market Value"      if "Market Value"      in meta.columns else None)
+
+    # close the loop
+    theta_closed = labels + [labels[0]]
 
-        # close the loop
-        theta_closed = labels + [labels[0]]
+    for player, vals in zip(wide.index, wide.to_numpy().tolist()):
         r_closed = vals + [vals[0]]
 
         # legend text from meta carried in df_long ---
-        age   = sub["Age"].iloc[0]   if "Age"   in sub.columns else None
-        squad = sub["Squad"].iloc[0] if "Squad" in sub.columns else None
-        if "Market Value (M€)" in sub.columns:
-            mv_val = sub["Market Value (M€)"].iloc[0]
-        elif "Market Value" in sub.columns:
-            mv_val = sub["Market Value"].iloc[0]
-        else:
-            mv_val = None
+        age    = meta.at[player, "Age"]   if "Age"   in meta.columns else None
+        squad  = meta.at[player, "Squad"] if "Squad" in meta.columns else None
+        mv_val = meta.at[player, mv_col]  if mv_col else None
 
         mv_txt = f"{float(mv_val):.1f} M€" if mv_val is not None and pd.notna(mv_val) else "N/A"
         legend_name = f"{player}{', ' + str(int(age)) + 'y' if age is not None else ''}"f"<br>{mv_txt}{' - ' + squad or 'N/A'}"
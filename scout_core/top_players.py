@@ -1,25 +1,30 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, Optional, Union, Dict
+from typing import List, Optional, Union, Dict, Tuple
+import numpy as np
 import pandas as pd
 
 # --- hardcoded config 
 STANDARD_COLS: List[str] = ["Player", "League", "Squad", "Position", "Age", "Nation","Market Value (M€)", "Matches", "Minutes","Goals","Assists"]
 
-FEATURE_MAP: Dict[str, List[str]] = {
-        "Goal Scoring": ["Goals_90m", "Goals not Penalty_90m"],
-        "Goal Efficacy": ["Goals Minus Expected_90m", "Goals/Shoot","Penalty Efficacy"],     
-        "Shooting": ["Shoots_90m","Shoots on Target_90m","Goals/Shoot","FreeKick Tacker"],
-        "Passing Influence": ["Short Cmp_90m","Medium Cmp_90m","Long Cmp_90m","Prog Passes_90m","Pass Prog Distance_90m"],
-        "Passing Accuracy": ['Cmp Passes%','Short Cmp%','Medium Cmp%','Long Cmp%'],
-        "Goal Creation": ['Assists_90m','Key Passes_90m','Goal Creating Actions_90m'],     
-        "Possession Influence": ['Touches_90m','Fouls Suffered_90m','Carries_90m'],
-        "Progression": ['Prog Carries_90m','Carries PrgDist_90m'],
-        "Dribling": ['Take-Ons Succ_90m','Take-Ons Succ%'],
-        "Aerial Influence": ['Aerial Duels_90m','Aerial Duels Won%'],     
-        "Defensive Influence": ['Tackles Won_90m','Blocks_90m','Interceptions_90m','Clearances_90m','Ball Recoveries_90m'],
-        "Discipline and Consistency": ['Own Goals_90m','Errors_90m','Yellow Cards_90m','Red Cards_90m','Fouls Commited_90m','Penalty Commited_90m']
+FEATURE_MAP: Dict[str, Tuple[str, ...]] = {
+        "Goal Scoring": ("Goals_90m", "Goals not Penalty_90m"),
+        "Goal Efficacy": ("Goals Minus Expected_90m", "Goals/Shoot","Penalty Efficacy"),     
+        "Shooting": ("Shoots_90m","Shoots on Target_90m","Goals/Shoot","FreeKick Tacker"),
+        "Passing Influence": ("Short Cmp_90m","Medium Cmp_90m","Long Cmp_90m","Prog Passes_90m","Pass Prog Distance_90m"),
+        "Passing Accuracy": ('Cmp Passes%','Short Cmp%','Medium Cmp%','Long Cmp%'),
+        "Goal Creation": ('Assists_90m','Key Passes_90m','Goal Creating Actions_90m'),     
+        "Possession Influence": ('Touches_90m','Fouls Suffered_90m','Carries_90m'),
+        "Progression": ('Prog Carries_90m','Carries PrgDist_90m'),
+        "Dribling": ('Take-Ons Succ_90m','Take-Ons Succ%'),
+        "Aerial Influence": ('Aerial Duels_90m','Aerial Duels Won%'),     
+        "Defensive Influence": ('Tackles Won_90m','Blocks_90m','Interceptions_90m','Clearances_90m','Ball Recoveries_90m'),
+        "Discipline and Consistency": ('Own Goals_90m','Errors_90m','Yellow Cards_90m','Red Cards_90m','Fouls Commited_90m','Penalty Commited_90m')
 }
+# skill names in display order, precomputed for the widgets
+FEATURE_MAP_KEYS: Tuple[str, ...] = tuple(FEATURE_MAP)
+# raw metric columns behind the skills (rounded for display)
+_METRIC_COLS = frozenset(c for cols in FEATURE_MAP.values() for c in cols)
 # ------------------------------------------------------------------------
 
 @dataclass(frozen=True)
@@ -34,21 +39,40 @@ class TopPlayersParams:
     max_MV: Optional[float] = None
     score_name: str = "Score"
 
+def _num(s: pd.Series) -> np.ndarray:
+    # float ndarray with NaN for missing/unparseable values: comparisons on NaN are False
+    return pd.to_numeric(s, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
 def _apply_filters(df: pd.DataFrame, p: TopPlayersParams) -> pd.DataFrame:
-    mask = pd.Series(True, index=df.index)
+    # plain numpy predicates, AND-ed once at the end (no per-step Series alignment)
+    preds: List[np.ndarray] = []
     if p.pos is not None:
-        mask &= (df["Position"] == p.pos) if isinstance(p.pos, str) else df["Position"].isin(p.pos)
-    if p.min_age is not None:      mask &= pd.to_numeric(df["Age"], errors="coerce") >= p.min_age
-    if p.max_age is not None:      mask &= pd.to_numeric(df["Age"], errors="coerce") <= p.max_age
-    if p.min_minutes is not None:  mask &= pd.to_numeric(df["Minutes"], errors="coerce") >= p.min_minutes
-    if p.max_minutes is not None:  mask &= pd.to_numeric(df["Minutes"], errors="coerce") <= p.max_minutes
+        pos = [p.pos] if isinstance(p.pos, str) else list(p.pos)
+        # single position (the app's case): plain equality, a code compare on categoricals
+        hit = (df["Position"] == pos[0]) if len(pos) == 1 else df["Position"].isin(pos)
+        preds.append(hit.to_numpy(dtype=bool, na_value=False))
+    # coerce each numeric filter column at most once
+    if (p.min_age is not None) or (p.max_age is not None):
+        age = _num(df["Age"])
+        if p.min_age is not None:  preds.append(age >= p.min_age)
+        if p.max_age is not None:  preds.append(age <= p.max_age)
+    if (p.min_minutes is not None) or (p.max_minutes is not None):
+        mins = _num(df["Minutes"])
+        if p.min_minutes is not None:  preds.append(mins >= p.min_minutes)
+        if p.max_minutes is not None:  preds.append(mins <= p.max_minutes)
     if (p.min_MV is not None) or (p.max_MV is not None):
-        mv = pd.to_numeric(df["Market Value (M€)"], errors="coerce")
-        in_range = pd.Series(True, index=df.index)
-        if p.min_MV is not None: in_range &= mv >= p.min_MV
-        if p.max_MV is not None: in_range &= mv <= p.max_MV
-        mask &= (in_range | mv.isna())  # include NaNs regardless
-    return df.loc[mask]
+        mv = _num(df["Market Value (M€)"])
+        keep = np.isnan(mv)  # include NaNs regardless
+        if p.min_MV is not None and p.max_MV is not None:
+            keep |= (mv >= p.min_MV) & (mv <= p.max_MV)
+        elif p.min_MV is not None:
+            keep |= mv >= p.min_MV
+        else:
+            keep |= mv <= p.max_MV
+        preds.append(keep)
+    if not preds:
+        return df
+    return df.loc[np.logical_and.reduce(preds)]
 
 def top_players(
     df: pd.DataFrame,
@@ -56,39 +80,38 @@ def top_players(
     params: TopPlayersParams = TopPlayersParams(),
 ) -> pd.DataFrame:
     """Equal-weight ranking over `selected_features`. Returns only configured columns."""
+    col_set = set(df.columns)  # one hash set for every presence check below
     req = {"Age", "Minutes", "Market Value (M€)", "Position"}
-    miss = [c for c in req if c not in df.columns]
+    miss = [c for c in req if c not in col_set]
     if miss: raise ValueError(f"Missing required columns: {miss}")
 
-    # ensure features numeric
-    out = df.copy()
-    feat_cols = [c for c in selected_features if c in out.columns]
+    feat_cols = [c for c in selected_features if c in col_set]
     if not feat_cols: raise ValueError("None of `selected_features` exist in DataFrame.")
-    out[feat_cols] = out[feat_cols].apply(pd.to_numeric, errors="coerce").fillna(0.0)
 
-    # filters
-    out = _apply_filters(out, params)
+    # filters first: only the surviving rows are copied and coerced
+    out = _apply_filters(df, params).copy()
 
-    # score (equal weights)
-    out[params.score_name] = out[feat_cols].mean(axis=1)
+    # ensure features numeric
+    out[feat_cols] = out[feat_cols].apply(pd.to_numeric, errors="coerce").fillna(0.0)
+
+    # score (equal weights): one 2-D numpy reduction instead of a per-row DataFrame mean
+    out[params.score_name] = out[feat_cols].to_numpy().mean(axis=1)
 
-    all_features = [col for cols in FEATURE_MAP.values() for col in cols]
-    for col in all_features:
-        if col in out.columns:
-            out[col] = out[col].round(1)
-    
     # column order: standard + score + selected + extras from FEATURE_MAP
-    extras: List[str] = []
-    for f in selected_features:
-        for c in FEATURE_MAP.get(f, []):
-            if c not in extras: extras.append(c)
+    extras = [c for f in selected_features for c in FEATURE_MAP.get(f, ())]
 
-    order = [c for c in (STANDARD_COLS + [params.score_name] + selected_features + extras) if c in out.columns]
+    col_set.add(params.score_name)
+    order = [c for c in dict.fromkeys(STANDARD_COLS + [params.score_name] + selected_features + extras) if c in col_set]
+    # partial selection of the top n instead of sorting every filtered row
     out = (out
-           .sort_values(params.score_name, ascending=False)
-           .head(params.n)
+           .nlargest(params.n, params.score_name)
+           .loc[:, order]
            .reset_index(drop=True))
-    
-    return out.loc[:, order]
 
-__all__ = ["TopPlayersParams", "top_players", "STANDARD_COLS", "FEATURE_MAP"]
\ No newline at end of file
+    # round the returned metric columns on the top-n rows only, in one call
+    metric_cols = [c for c in order if c in _METRIC_COLS]
+    if metric_cols:
+        out[metric_cols] = out[metric_cols].round(1)
+    return out
+
+__all__ = ["TopPlayersParams", "top_players", "STANDARD_COLS", "FEATURE_MAP", "FEATURE_MAP_KEYS"]
\ No newline at end of file